@@ -1,148 +1,319 @@
 import os
 import gc
 import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
+from matplotlib.image import pil_to_array
 from PIL import Image
 import numpy as np
 import time
 from functools import lru_cache
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, NamedTuple
+
+try:
+    from numba import njit  # Optional: JIT-compiles the animation math
+except ImportError:
+    njit = None
+
+def _interpolate_bounds_numpy(start, end, n, out):
+    """Fill out[:n] with smoothstep-eased bounds from start to end (a single frame is the end)"""
+    t = np.linspace(0.0, 1.0, n) if n > 1 else np.ones(n)
+    t = t * t * (3.0 - 2.0 * t)
+    out[:n] = start[None, :] * (1.0 - t)[:, None] + end[None, :] * t[:, None]
+
+def _interpolate_bounds_loop(start, end, n, out):
+    """Same as _interpolate_bounds_numpy, written as loops for Numba"""
+    for i in range(n):
+        t = i / (n - 1) if n > 1 else 1.0
+        t = t * t * (3.0 - 2.0 * t)
+        inv = 1.0 - t
+        for k in range(4):
+            out[i, k] = start[k] * inv + end[k] * t
+
+if njit is not None:
+    interpolate_bounds = njit(cache=True, fastmath=True)(_interpolate_bounds_loop)
+else:
+    interpolate_bounds = _interpolate_bounds_numpy
+
+# Smallest size images are decoded at, however small the canvas gets
+MIN_DISPLAY_SIZE = 256
+
+class Geom(NamedTuple):
+    """Quadrant geometry derived from an image size"""
+    mid_x: int
+    mid_y: int
+    positions: Tuple[Tuple[int, int], ...]  # Label centre of each quadrant
+    bounds: Tuple[Tuple[int, int, int, int], ...]  # (x1, y1, x2, y2) of each quadrant
+
+@lru_cache(maxsize=64)
+def compute_geom(size: Tuple[int, int]) -> Geom:
+    """Quadrant geometry for an image size - memoized, sizes repeat across tiles"""
+    img_width, img_height = size
+    mid_x, mid_y = img_width >> 1, img_height >> 1  # Bit shift is faster than //
+    
+    positions = (
+        (mid_x >> 1, mid_y >> 1),
+        (mid_x + (mid_x >> 1), mid_y >> 1),
+        (mid_x >> 1, mid_y + (mid_y >> 1)),
+        (mid_x + (mid_x >> 1), mid_y + (mid_y >> 1))
+    )
+    bounds = (
+        (0, 0, mid_x, mid_y),                   # top-left
+        (mid_x, 0, img_width, mid_y),           # top-right
+        (0, mid_y, mid_x, img_height),          # bottom-left
+        (mid_x, mid_y, img_width, img_height)   # bottom-right
+    )
+    return Geom(mid_x, mid_y, positions, bounds)
+
+def _release_resources(image_cache, cache_lock, prefetch_pool):
+    """Stop prefetching and close cached images - takes plain data, not the viewer"""
+    # Stop prefetching before the cache is torn down
+    prefetch_pool.shutdown(wait=True, cancel_futures=True)
+    
+    with cache_lock:
+        for img, _ in image_cache.values():
+            img.close()
+        image_cache.clear()
 
 class OptimizedQuadrantZoomViewer:
     def __init__(self, root_image_path="root.png", cache_size=16):
         self.root_image_path = root_image_path
-        self.current_path = ""  # Current zoom path (e.g., "0_2_1")
+        self.current_path_tuple: Tuple[int, ...] = ()  # Current zoom path (e.g., (0, 2, 1))
         self.current_image = None
+        self._current_array = None  # Pixels of current_image, converted once per load
         self.fig, self.ax = plt.subplots(figsize=(10, 10))
         self.fig.canvas.mpl_connect('scroll_event', self.on_scroll)
         self.fig.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+        self.fig.canvas.mpl_connect('resize_event', self.on_resize)
+        self.fig.canvas.mpl_connect('key_press_event', self.on_key_press)
+        
+        # Images are decoded no larger than the canvas they are shown on
+        self._display_size = self._canvas_size()
 
         self.mouse_quadrant = 0  # Track which quadrant mouse is over
+        self._cur_quad_bounds = (0, 0, 0, 0)  # Bounds of mouse_quadrant in the displayed image
         
         # Animation state - using __slots__ equivalent with explicit cleanup
         self.is_animating = False
         self.animation_frames = 20
-        self.current_frame = 0
+        self.frame_interval = 33  # ms, ~30 FPS
         self.zoom_target = None
         self.zoom_start_bounds = None
         self.zoom_end_bounds = None
-        self.pending_path = None
+        self._bounds_table = np.empty((self.animation_frames, 4))  # Interpolated view bounds
+        self.pending_path_tuple = None
         self.zoom_direction = 1  # 1 for zoom in, -1 for zoom out
-        self.animation_timer = None
+        self._anim = None  # FuncAnimation driving the current zoom
         
-        # Memory optimization: Image cache with weak references
-        self._image_cache: Dict[str, Any] = {}
+        # Memory optimization: LRU image cache (most recently used at the end)
+        self._image_cache: "OrderedDict[Tuple[int, ...], Tuple[Image.Image, np.ndarray]]" = OrderedDict()
         self._cache_size = cache_size
         
-        # Pre-allocate numpy arrays for quadrant bounds to avoid repeated allocation
-        self._quadrant_bounds_cache = {}
-        
-        # Optimize matplotlib patches - reuse rectangles
-        self._highlight_rect = None
-        self._text_objects = []
-        
-        # Enable garbage collection optimizations
-        gc.set_threshold(700, 10, 10)  # More aggressive GC
+        # Filenames per zoom path, built on first use
+        self._base_name, self._extension = os.path.splitext(root_image_path)
+        self._filenames: Dict[Tuple[int, ...], str] = {(): root_image_path}
+        self._cache_lock = threading.Lock()
+        self._placeholder = None  # (image, array) for missing files, never evicted
+        
+        # Background loading of the children of the current view
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        
+        # Runs on cleanup() or when the viewer is collected, whichever comes first
+        self._finalizer = weakref.finalize(self, _release_resources, self._image_cache,
+                                           self._cache_lock, self._prefetch_pool)
+        
+        # Pooled overlay artists, created once and repositioned on every redraw.
+        # Highlight and labels are animated (blitted above the image), grid lines are not
+        self._highlight_rect = patches.Rectangle((0, 0), 0, 0, linewidth=3, edgecolor='yellow',
+                                                 facecolor='yellow', alpha=0.2,
+                                                 animated=True, visible=False, zorder=3)
+        self.ax.add_patch(self._highlight_rect)
+        text_props = dict(fontsize=20, ha='center', va='center', animated=True, visible=False, zorder=4,
+                          bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+        self._quadrant_labels = [self.ax.text(0, 0, str(i), **text_props) for i in range(4)]
+        line_props = dict(color='red', linestyle='--', alpha=0.7, linewidth=2, visible=False)
+        self._grid_lines = [self.ax.axhline(y=0, **line_props), self.ax.axvline(x=0, **line_props)]
+        
+        # Reused image artist (recreated only when the image size changes)
+        self._im_artist = None
+        self._last_image_size = None
+        
+        # Blitting: pixel buffer of the axes without the animated artists
+        self._bg = None
+
+        # Warm up the interpolation kernel so the first zoom doesn't pay for JIT
+        interpolate_bounds(np.zeros(4), np.ones(4), self.animation_frames, self._bounds_table)
         
         # Load and display the root image
         self.load_current_image()
         self.display_image()
-    
-    def __del__(self):
-        """Cleanup resources when object is destroyed"""
-        self.cleanup()
+        self.prefetch_children()
     
     def cleanup(self):
         """Explicit cleanup method"""
-        # Clear image cache
-        for img in self._image_cache.values():
-            if hasattr(img, 'close'):
-                img.close()
-        self._image_cache.clear()
+        # Stop prefetching and clear image cache
+        self._finalizer()
         
         # Clear matplotlib objects
         if self._highlight_rect:
             self._highlight_rect.remove()
-        for text_obj in self._text_objects:
+            self._highlight_rect = None
+        for text_obj in self._quadrant_labels:
             text_obj.remove()
-        self._text_objects.clear()
-        
-        # Stop animation timer
-        if self.animation_timer:
-            self.animation_timer.stop()
-            self.animation_timer = None
+        self._quadrant_labels.clear()
+        for line in self._grid_lines:
+            line.remove()
+        self._grid_lines.clear()
         
-        # Clear bounds cache
-        self._quadrant_bounds_cache.clear()
+        # Stop a running zoom animation
+        if self._anim is not None and self._anim.event_source is not None:
+            self._anim.event_source.stop()
+        self._anim = None
         
         # Force garbage collection
         gc.collect()
     
-    @lru_cache(maxsize=32)
-    def get_image_filename(self, path: str = "") -> str:
-        """Generate filename based on current path - cached to avoid string operations"""
-        if path == "":
-            return self.root_image_path
-        else:
-            base_name, extension = os.path.splitext(self.root_image_path)
-            return f"{base_name}_{path}{extension}"
+    def get_image_filename(self, path: Tuple[int, ...] = ()) -> str:
+        """Generate filename for a zoom path - memoized to avoid string operations"""
+        filename = self._filenames.get(path)
+        if filename is None:
+            filename = f"{self._base_name}_{'_'.join(map(str, path))}{self._extension}"
+            self._filenames[path] = filename
+        return filename
     
     def load_current_image(self):
         """Load the current image based on the current path with caching"""
-        filename = self.get_image_filename(self.current_path)
+        path = self.current_path_tuple
         
         # Check cache first
-        if filename in self._image_cache:
-            self.current_image = self._image_cache[filename]
-            return
+        with self._cache_lock:
+            if path in self._image_cache:
+                self._image_cache.move_to_end(path)
+                self.current_image, self._current_array = self._image_cache[path]
+                return
         
+        filename = self.get_image_filename(path)
         try:
             # Load image
-            img = Image.open(filename)
-            
-            # Cache management - remove oldest if cache is full
-            if len(self._image_cache) >= self._cache_size:
-                # Remove oldest entry (simple FIFO)
-                oldest_key = next(iter(self._image_cache))
-                old_img = self._image_cache.pop(oldest_key)
-                if hasattr(old_img, 'close'):
-                    old_img.close()
-                # Force garbage collection after removing old image
-                gc.collect()
+            img = self.open_image(filename)
             
-            # Add to cache
-            self._image_cache[filename] = img
-            self.current_image = img
+            self.current_image, self._current_array = self._cache_put(path, img)
             print(f"Loaded and cached: {filename}")
             
         except FileNotFoundError:
             print(f"Image not found: {filename}")
-            # Create and cache placeholder
-            if "placeholder" not in self._image_cache:
-                self._image_cache["placeholder"] = self.create_placeholder_image()
-            self.current_image = self._image_cache["placeholder"]
+            # Create the placeholder once and keep it out of the LRU cache
+            if self._placeholder is None:
+                placeholder = self.create_placeholder_image()
+                self._placeholder = (placeholder, self.to_array(placeholder))
+            self.current_image, self._current_array = self._placeholder
+    
+    def open_image(self, filename: str) -> Image.Image:
+        """Decode an image downsampled to the display size and close its file"""
+        with Image.open(filename) as src:
+            # JPEG only: let libjpeg decode at a reduced DCT scale
+            src.draft("RGB", self._display_size)
+            img = src.copy()  # Forces the decode and detaches from the file
+        img.thumbnail(self._display_size, Image.Resampling.BILINEAR)
+        return img
+    
+    def _canvas_size(self) -> Tuple[int, int]:
+        """Canvas size in pixels, clamped to MIN_DISPLAY_SIZE"""
+        width, height = self.fig.get_size_inches() * self.fig.dpi
+        return max(int(width), MIN_DISPLAY_SIZE), max(int(height), MIN_DISPLAY_SIZE)
+    
+    def on_resize(self, event):
+        """Track the canvas size so newly loaded images match it"""
+        width, height = self.fig.get_size_inches() * self.fig.dpi
+        if width < 1 or height < 1:
+            return  # Collapsed or minimized window - keep the current target
+        
+        old_width, old_height = self._display_size
+        self._display_size = new_width, new_height = self._canvas_size()
+        if new_width <= old_width and new_height <= old_height:
+            return
+        
+        # The canvas grew: drop tiles decoded smaller than it so they get decoded again
+        with self._cache_lock:
+            stale = [path for path, (img, _) in self._image_cache.items()
+                     if img.width < new_width and img.height < new_height]
+            for path in stale:
+                img, _ = self._image_cache.pop(path)
+                if img is not self.current_image:
+                    img.close()
+        
+        if self.current_path_tuple in stale and not self.is_animating:
+            self.load_current_image()
+            self.display_image()
+    
+    @staticmethod
+    def to_array(img: Image.Image) -> np.ndarray:
+        """Pixel array handed to matplotlib - converted the way imshow converts PIL images"""
+        # pil_to_array turns palette, CMYK and other modes into RGB(A) instead of raw bands
+        return np.ascontiguousarray(pil_to_array(img))
+    
+    def _cache_put(self, path: Tuple[int, ...], img: Image.Image) -> Tuple[Image.Image, np.ndarray]:
+        """Insert an image as most recently used and return the cached (image, array) entry"""
+        arr = self.to_array(img)  # Convert outside the lock
+        with self._cache_lock:
+            # Another thread may have cached the same file in the meantime
+            if path in self._image_cache:
+                img.close()
+                self._image_cache.move_to_end(path)
+                return self._image_cache[path]
+            
+            # Cache management - evict least recently used if cache is full
+            if len(self._image_cache) >= self._cache_size:
+                old_key, (old_img, _) = self._image_cache.popitem(last=False)
+                # Never close the image that is still on screen
+                if old_img is not self.current_image:
+                    old_img.close()
+            
+            # Add to cache (inserted as most recently used)
+            entry = self._image_cache[path] = (img, arr)
+            return entry
+    
+    def prefetch_children(self):
+        """Load the four child images of the current view in the background"""
+        for quadrant in range(4):
+            self._prefetch_pool.submit(self._prefetch, self.current_path_tuple + (quadrant,))
+    
+    def _prefetch(self, path: Tuple[int, ...]):
+        """Decode one image into the cache (runs on the prefetch pool)"""
+        with self._cache_lock:
+            if path in self._image_cache:
+                return
+        
+        filename = self.get_image_filename(path)
+        
+        try:
+            img = self.open_image(filename)  # Decodes now, off the UI thread
+        except FileNotFoundError:
+            return
+        
+        self._cache_put(path, img)
     
     def create_placeholder_image(self) -> Image.Image:
         """Create a placeholder image with quadrant numbers - optimized"""
-        # Use more efficient numpy array creation
-        pixels = np.empty((400, 400, 3), dtype=np.uint8)
-        
-        # Fill quadrants using array slicing (more efficient than pixel-by-pixel)
         mid_h, mid_w = 200, 200
         
-        # Use memoryview for even faster access
-        pixels_view = memoryview(pixels)
+        def quadrant(color):
+            # Read-only broadcast view - no pixels are written until np.block
+            return np.broadcast_to(np.array(color, dtype=np.uint8), (mid_h, mid_w, 3))
         
-        # Quadrant 0 (top-left) - light blue
-        pixels[:mid_h, :mid_w] = [173, 216, 230]
-        # Quadrant 1 (top-right) - light green
-        pixels[:mid_h, mid_w:] = [144, 238, 144]
-        # Quadrant 2 (bottom-left) - light coral
-        pixels[mid_h:, :mid_w] = [240, 128, 128]
-        # Quadrant 3 (bottom-right) - light yellow
-        pixels[mid_h:, mid_w:] = [255, 255, 224]
+        # np.block joins the innermost lists along the last axis, so the
+        # channel axis gets its own (single-element) nesting level
+        pixels = np.block([
+            # Quadrant 0 (top-left) light blue, quadrant 1 (top-right) light green
+            [[quadrant([173, 216, 230])], [quadrant([144, 238, 144])]],
+            # Quadrant 2 (bottom-left) light coral, quadrant 3 (bottom-right) light yellow
+            [[quadrant([240, 128, 128])], [quadrant([255, 255, 224])]],
+        ])
         
         return Image.fromarray(pixels)
     
@@ -151,82 +322,53 @@ class OptimizedQuadrantZoomViewer:
         if not self.current_image:
             return (0, 0, 0, 0)
         
-        cache_key = (self.current_image.size, quadrant)
-        if cache_key in self._quadrant_bounds_cache:
-            return self._quadrant_bounds_cache[cache_key]
-        
-        img_width, img_height = self.current_image.size
-        mid_x, mid_y = img_width >> 1, img_height >> 1  # Bit shift is faster than //
-        
-        bounds_map = {
-            0: (0, 0, mid_x, mid_y),           # top-left
-            1: (mid_x, 0, img_width, mid_y),   # top-right
-            2: (0, mid_y, mid_x, img_height),  # bottom-left
-            3: (mid_x, mid_y, img_width, img_height)  # bottom-right
-        }
-        
-        bounds = bounds_map[quadrant]
-        self._quadrant_bounds_cache[cache_key] = bounds
-        return bounds
+        return compute_geom(self.current_image.size).bounds[quadrant]
     
     def display_image(self):
         """Display the current image with quadrant grid overlay - optimized"""
-        # Clear only what's necessary
-        if self._highlight_rect:
-            self._highlight_rect.remove()
-            self._highlight_rect = None
-        
-        for text_obj in self._text_objects:
-            text_obj.remove()
-        self._text_objects.clear()
-        
-        # Only clear axes if we have a new image
-        if not hasattr(self, '_last_image_size') or self._last_image_size != self.current_image.size:
-            self.ax.clear()
-            self._last_image_size = self.current_image.size
-        
+        relayout = False
         if self.current_image:
-            # Display the image
-            self.ax.imshow(self.current_image)
+            # Reuse the image artist; a new one is only needed when the size changes
+            if self._im_artist is None or self._last_image_size != self.current_image.size:
+                if self._im_artist is not None:
+                    self._im_artist.remove()
+                self._im_artist = self.ax.imshow(self._current_array)
+                self._last_image_size = self.current_image.size
+                relayout = True  # set_aspect resizes the axes for a new aspect ratio
+            else:
+                self._im_artist.set_data(self._current_array)
             
             # Only show grid and highlights if not animating
             if not self.is_animating:
                 # Add quadrant grid overlay
-                img_width, img_height = self.current_image.size
-                mid_x, mid_y = img_width >> 1, img_height >> 1
+                geom = compute_geom(self.current_image.size)
                 
-                # Draw grid lines
-                self.ax.axhline(y=mid_y, color='red', linestyle='--', alpha=0.7, linewidth=2)
-                self.ax.axvline(x=mid_x, color='red', linestyle='--', alpha=0.7, linewidth=2)
+                # Move the grid lines
+                hline, vline = self._grid_lines
+                hline.set_ydata([geom.mid_y, geom.mid_y])
+                vline.set_xdata([geom.mid_x, geom.mid_x])
                 
                 # Highlight the quadrant where mouse is hovering
-                x1, y1, x2, y2 = self.get_quadrant_bounds(self.mouse_quadrant)
-                self._highlight_rect = patches.Rectangle((x1, y1), x2-x1, y2-y1, 
-                                                       linewidth=3, edgecolor='yellow', 
-                                                       facecolor='yellow', alpha=0.2)
-                self.ax.add_patch(self._highlight_rect)
-                
-                # Add quadrant labels - reuse text objects
-                text_props = dict(fontsize=20, ha='center', va='center',
-                                bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+                self.update_highlight()
                 
-                positions = [
-                    (mid_x >> 1, mid_y >> 1, '0'),
-                    (mid_x + (mid_x >> 1), mid_y >> 1, '1'),
-                    (mid_x >> 1, mid_y + (mid_y >> 1), '2'),
-                    (mid_x + (mid_x >> 1), mid_y + (mid_y >> 1), '3')
-                ]
+                # Move the pooled quadrant labels
+                for text_obj, position in zip(self._quadrant_labels, geom.positions):
+                    text_obj.set_position(position)
                 
-                for x, y, label in positions:
-                    text_obj = self.ax.text(x, y, label, **text_props)
-                    self._text_objects.append(text_obj)
+                overlay_visible = True
+            else:
+                overlay_visible = False
+            
+            for artist in self._overlay_artists():
+                artist.set_visible(overlay_visible)
             
             # Set title based on animation state
             if self.is_animating:
                 action = "Zooming in..." if self.zoom_direction == 1 else "Zooming out..."
                 self.ax.set_title(f"{action}", fontsize=12, pad=20)
             else:
-                self.ax.set_title(f"Current Path: {self.current_path if self.current_path else 'root'}\n"
+                path_label = '_'.join(map(str, self.current_path_tuple)) or 'root'
+                self.ax.set_title(f"Current Path: {path_label}\n"
                                 f"Scroll up over a quadrant to zoom in, scroll down to zoom out", 
                                 fontsize=12, pad=20)
         
@@ -236,53 +378,112 @@ class OptimizedQuadrantZoomViewer:
             self.ax.set_ylim(self.current_image.size[1], 0)  # Flip Y axis for image coordinates
         
         self.ax.set_aspect('equal')
-        plt.tight_layout()
-        plt.draw()
+        if relayout:
+            # Keep the title on the canvas - only needed when the image size changes
+            self.fig.tight_layout()
+        self.fig.canvas.draw_idle()
+    
+    def update_highlight(self):
+        """Move the highlight rectangle onto the quadrant under the mouse"""
+        x1, y1, x2, y2 = self._cur_quad_bounds = self.get_quadrant_bounds(self.mouse_quadrant)
+        self._highlight_rect.set_bounds(x1, y1, x2-x1, y2-y1)
+    
+    def _overlay_artists(self):
+        """Grid lines, quadrant labels and highlight drawn on top of the image"""
+        artists = self._grid_lines + self._quadrant_labels
+        if self._highlight_rect:
+            artists.append(self._highlight_rect)
+        return artists
+    
+    def _animated_artists(self):
+        """Artists kept out of the cached background and drawn on every blit"""
+        if self.is_animating:
+            return [self._im_artist] if self._im_artist is not None else []
+        artists = [artist for artist in self._overlay_artists()
+                   if artist.get_animated() and artist.get_visible()]
+        artists.sort(key=lambda artist: artist.get_zorder())
+        return artists
+    
+    def on_draw(self, event):
+        """Cache the axes background after every full draw"""
+        canvas = self.fig.canvas
+        if event is not None and event.canvas != canvas:
+            return
+        if canvas.is_saving() or not canvas.supports_blit:
+            # savefig (possibly on a vector canvas) - draw the animated artists into
+            # the output like any other artist and leave the on-screen background alone
+            for artist in self._animated_artists():
+                artist.draw(event.renderer)
+            return
+        self._bg = canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+    
+    def blit(self):
+        """Restore the cached background and redraw only the animated artists"""
+        if self._bg is None:
+            self.fig.canvas.draw_idle()
+            return
+        canvas = self.fig.canvas
+        canvas.restore_region(self._bg)
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+    
+    def _init_anim(self):
+        """FuncAnimation init: the image is the only artist redrawn per frame"""
+        return [self._im_artist] if self._im_artist is not None else []
+    
+    def _frame_sequence(self):
+        """Frame indices paced by wall clock, followed by the completion step"""
+        start = time.perf_counter()
+        last_frame = self.animation_frames - 1
+        frame = 0
+        while frame < last_frame:
+            yield frame
+            # Drop frames a slow draw overran so the zoom keeps its duration
+            due = int((time.perf_counter() - start) * 1000 // self.frame_interval)
+            frame = min(max(frame + 1, due), last_frame)
+        yield last_frame
+        yield self.animation_frames
     
     def animate_zoom(self, frame: int):
-        """Animation function for smooth zooming - optimized"""
+        """Animation function for smooth zooming - returns the artists to blit"""
         if frame >= self.animation_frames:
             # Animation complete
             self.is_animating = False
+            if self._im_artist is not None:
+                self._im_artist.set_animated(False)
             
             if self.zoom_direction == 1:  # Zoom in complete
                 # Load the new image
-                self.current_path = self.pending_path
+                self.current_path_tuple = self.pending_path_tuple
                 self.load_current_image()
                 self.display_image()
             else:  # Zoom out complete
                 # Just update display
                 self.display_image()
             
-            # Clean up animation timer
-            if self.animation_timer:
-                self.animation_timer.stop()
-                self.animation_timer = None
+            # Warm the cache for the next zoom in
+            self.prefetch_children()
             
-            return
+            # display_image scheduled a full redraw; nothing left to blit
+            return []
         
-        # Calculate interpolation factor (0 to 1)
-        t = frame / (self.animation_frames - 1)
-        
-        # Smooth easing function (ease-in-out) - optimized
-        t = t * t * (3.0 - 2.0 * t)
-        
-        # Interpolate between start and end bounds
-        start_x1, start_y1, start_x2, start_y2 = self.zoom_start_bounds
-        end_x1, end_y1, end_x2, end_y2 = self.zoom_end_bounds
-        
-        # Use faster arithmetic
-        inv_t = 1.0 - t
-        current_x1 = start_x1 * inv_t + end_x1 * t
-        current_y1 = start_y1 * inv_t + end_y1 * t
-        current_x2 = start_x2 * inv_t + end_x2 * t
-        current_y2 = start_y2 * inv_t + end_y2 * t
+        # Bounds were interpolated up front in start_zoom_animation
+        x1, y1, x2, y2 = self._bounds_table[frame]
         
         # Set the view bounds
-        self.ax.set_xlim(current_x1, current_x2)
-        self.ax.set_ylim(current_y2, current_y1)  # Flip Y axis for image coordinates
-        
-        plt.draw()
+        self.ax.set_xlim(x1, x2)
+        self.ax.set_ylim(y2, y1)  # Flip Y axis for image coordinates
+
+        # on_draw painted the image over the canvas buffer, and FuncAnimation copies its
+        # background from that buffer whenever the view changes - hand it the clean one
+        if self._bg is not None:
+            self.fig.canvas.restore_region(self._bg)
+
+        # Only the image changes between frames - FuncAnimation blits it
+        return [self._im_artist]
     
     def start_zoom_animation(self, target_quadrant: int, zoom_in: bool = True):
         """Start zoom animation to a specific quadrant"""
@@ -300,50 +501,40 @@ class OptimizedQuadrantZoomViewer:
             self.zoom_end_bounds = self.get_quadrant_bounds(target_quadrant)
             
             # Prepare new path
-            if self.current_path:
-                self.pending_path = f"{self.current_path}_{target_quadrant}"
-            else:
-                self.pending_path = str(target_quadrant)
+            self.pending_path_tuple = self.current_path_tuple + (target_quadrant,)
         else:
             # Zoom out from current view
             self.zoom_start_bounds = (0, 0, img_width, img_height)
             self.zoom_end_bounds = (0, 0, img_width, img_height)
             
             # Update current path
-            if self.current_path:
-                path_parts = self.current_path.split('_')
-                if len(path_parts) > 1:
-                    self.current_path = '_'.join(path_parts[:-1])
-                else:
-                    self.current_path = ""
+            if self.current_path_tuple:
+                last_quadrant = self.current_path_tuple[-1]
+                self.current_path_tuple = self.current_path_tuple[:-1]
                 
                 # Load the parent image
                 self.load_current_image()
                 
-                # Calculate which quadrant we're zooming out from
-                if path_parts:
-                    last_quadrant = int(path_parts[-1])
-                    self.zoom_start_bounds = self.get_quadrant_bounds(last_quadrant)
-                    self.zoom_end_bounds = (0, 0, self.current_image.size[0], self.current_image.size[1])
-        
-        # Start animation with optimized timer
-        self.current_frame = 0
-        if self.animation_timer:
-            self.animation_timer.stop()
-        
-        self.animation_timer = self.fig.canvas.new_timer(interval=33)  # ~30 FPS for smoother animation
-        self.animation_timer.add_callback(self.animate_step)
-        self.animation_timer.start()
-    
-    def animate_step(self):
-        """Single step of animation"""
-        if self.current_frame >= self.animation_frames:
-            self.animation_timer.stop()
-            self.animate_zoom(self.current_frame)
-            return
-        
-        self.animate_zoom(self.current_frame)
-        self.current_frame += 1
+                # Zoom out from the quadrant we came from
+                self.zoom_start_bounds = self.get_quadrant_bounds(last_quadrant)
+                self.zoom_end_bounds = (0, 0, self.current_image.size[0], self.current_image.size[1])
+        
+        # Precompute every frame's bounds with smooth ease-in-out easing
+        if len(self._bounds_table) < self.animation_frames:
+            self._bounds_table = np.empty((self.animation_frames, 4))
+        start = np.asarray(self.zoom_start_bounds, dtype=np.float64)
+        end = np.asarray(self.zoom_end_bounds, dtype=np.float64)
+        interpolate_bounds(start, end, self.animation_frames, self._bounds_table)
+        
+        # FuncAnimation starts on the next draw event
+        self._anim = FuncAnimation(self.fig, self.animate_zoom, frames=self._frame_sequence,
+                                   init_func=self._init_anim, interval=self.frame_interval,
+                                   blit=True, repeat=False, cache_frame_data=False)
+        
+        # Take the image out of the background so frames only redraw the axes
+        if self._im_artist is not None:
+            self._im_artist.set_animated(True)
+        self.fig.canvas.draw()
     
     def on_mouse_move(self, event):
         """Handle mouse movement to track which quadrant mouse is over"""
@@ -355,17 +546,20 @@ class OptimizedQuadrantZoomViewer:
         if x is None or y is None:
             return
         
-        # Determine which quadrant mouse is over - optimized with bit operations
-        img_width, img_height = self.current_image.size
-        mid_x, mid_y = img_width >> 1, img_height >> 1
+        # Early out while the mouse stays inside the highlighted quadrant
+        b = self._cur_quad_bounds
+        if b[0] <= x < b[2] and b[1] <= y < b[3]:
+            return
         
-        # Use bitwise operations for quadrant calculation
-        new_quadrant = (2 if y >= mid_y else 0) + (1 if x >= mid_x else 0)
+        # Determine which quadrant mouse is over
+        geom = compute_geom(self.current_image.size)
+        new_quadrant = (2 if y >= geom.mid_y else 0) + (1 if x >= geom.mid_x else 0)
         
-        # Only redraw if quadrant changed
+        # Only the highlight moves - blit it over the cached background
         if new_quadrant != self.mouse_quadrant:
             self.mouse_quadrant = new_quadrant
-            self.display_image()
+            self.update_highlight()
+            self.blit()
     
     def on_scroll(self, event):
         """Handle mouse scroll events"""
@@ -377,10 +571,16 @@ class OptimizedQuadrantZoomViewer:
             self.start_zoom_animation(self.mouse_quadrant, zoom_in=True)
             
         elif event.button == 'down':  # Scroll down - zoom out
-            if self.current_path:
-                print(f"Zooming out from path: {self.current_path}")
+            if self.current_path_tuple:
+                print(f"Zooming out from path: {'_'.join(map(str, self.current_path_tuple))}")
                 self.start_zoom_animation(0, zoom_in=False)  # quadrant doesn't matter for zoom out
     
+    def on_key_press(self, event):
+        """Handle key presses - 'b' goes back (zoom out), 'q' quits via matplotlib's keymap"""
+        if event.key == 'b' and self.current_path_tuple and not self.is_animating:
+            print(f"Zooming out from path: {'_'.join(map(str, self.current_path_tuple))}")
+            self.start_zoom_animation(0, zoom_in=False)
+    
     def run(self):
         """Run the viewer"""
         try: